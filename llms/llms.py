@@ -4,7 +4,6 @@ import statistics
 import threading
 import time
 import queue
-import concurrent.futures
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
@@ -37,6 +36,29 @@ from .results.result import AsyncStreamResult, Result, Results, StreamResult
 
 LOGGER = getLogger(__name__)
 
+# Static evaluator instructions, kept as a module constant so the system
+# block is byte-identical on every call and provider-side prompt caches can
+# hit on the shared prefix; only the query/answer pair varies per request.
+EVALUATOR_SYSTEM_PROMPT = """You are an evaluator for an AI system. Your task is to determine whether the AI's answer matches the correct answer. You will be given two inputs: the AI's answer and the correct answer. Your job is to compare these and output a binary score: 1 if the AI's answer is correct, and 0 if it is not.
+
+        To evaluate the AI's performance:
+        1. Carefully compare the AI's answer to the correct answer.
+        2. Consider the following:
+           - Does the AI's answer convey the same meaning as the correct answer?
+           - Are there any significant discrepancies or omissions in the AI's answer?
+           - If there are minor differences in wording but the core information is the same, consider it correct.
+
+        After your evaluation, provide your assessment in the following format:
+        <evaluation>
+        [Your reasoning for the score]
+        </evaluation>
+        <score>[0 or 1]</score>
+
+        Remember, output only 0 (not correct) or 1 (correct) as the final score. Do not include any additional explanation or text outside of the specified tags."""
+
+_SCORE_RE = re.compile(r"<score>(\d)</score>")
+_BINARY_SCORE_RE = re.compile(r"\b[01]\b")
+
 
 @dataclass
 class Provider:
@@ -57,29 +79,48 @@ def create_provider(
     )
 
 
+_PROVIDER_MAP: Dict[str, Provider] = {
+    "OpenAI": create_provider(OpenAIProvider, "OPENAI_API_KEY"),
+    "Anthropic": create_provider(AnthropicProvider, "ANTHROPIC_API_KEY"),
+    "BedrockAnthropic": create_provider(
+        BedrockAnthropicProvider, needs_api_key=False
+    ),
+    "AI21": create_provider(AI21Provider, "AI21_API_KEY"),
+    "Cohere": create_provider(CohereProvider, "COHERE_API_KEY"),
+    "AlephAlpha": create_provider(AlephAlphaProvider, "ALEPHALPHA_API_KEY"),
+    "HuggingfaceHub": create_provider(
+        HuggingfaceHubProvider, "HUGGINFACEHUB_API_KEY"
+    ),
+    "GoogleGenAI": create_provider(GoogleGenAIProvider, "GOOGLE_API_KEY"),
+    "Mistral": create_provider(MistralProvider, "MISTRAL_API_KEY"),
+    "Google": create_provider(GoogleProvider, needs_api_key=False),
+    "Ollama": create_provider(OllamaProvider, needs_api_key=False),
+    "DeepSeek": create_provider(DeepSeekProvider, "DEEPSEEK_API_KEY"),
+    "Groq": create_provider(GroqProvider, "GROQ_API_KEY"),
+    "Reka": create_provider(RekaProvider, "REKA_API_KEY"),
+    "Together": create_provider(TogetherProvider, "TOGETHER_API_KEY"),
+    "OpenRouter": create_provider(OpenRouterProvider, "OPENROUTER_API_KEY"),
+}
+
+# Model name -> provider-map keys serving it, computed once at import so
+# provider dispatch is O(1) per model instead of a scan over every provider.
+# A model can be served by several providers, in provider-map order.
+_MODEL_TO_PROVIDERS: Dict[str, List[str]] = {}
+for _name, _provider in _PROVIDER_MAP.items():
+    for _model in _provider.provider.MODEL_INFO:
+        _MODEL_TO_PROVIDERS.setdefault(_model, []).append(_name)
+
+# Cross-provider model catalogue, built once since MODEL_INFO is class-level
+# and static; list() only filters over it.
+_ALL_MODELS: List[Dict[str, Any]] = [
+    {"provider": provider.provider.__name__, "name": model, "cost": cost}
+    for provider in _PROVIDER_MAP.values()
+    for model, cost in provider.provider.MODEL_INFO.items()
+]
+
+
 class LLMS:
-    _provider_map: Dict[str, Provider] = {
-        "OpenAI": create_provider(OpenAIProvider, "OPENAI_API_KEY"),
-        "Anthropic": create_provider(AnthropicProvider, "ANTHROPIC_API_KEY"),
-        "BedrockAnthropic": create_provider(
-            BedrockAnthropicProvider, needs_api_key=False
-        ),
-        "AI21": create_provider(AI21Provider, "AI21_API_KEY"),
-        "Cohere": create_provider(CohereProvider, "COHERE_API_KEY"),
-        "AlephAlpha": create_provider(AlephAlphaProvider, "ALEPHALPHA_API_KEY"),
-        "HuggingfaceHub": create_provider(
-            HuggingfaceHubProvider, "HUGGINFACEHUB_API_KEY"
-        ),
-        "GoogleGenAI": create_provider(GoogleGenAIProvider, "GOOGLE_API_KEY"),
-        "Mistral": create_provider(MistralProvider, "MISTRAL_API_KEY"),
-        "Google": create_provider(GoogleProvider, needs_api_key=False),
-        "Ollama": create_provider(OllamaProvider, needs_api_key=False),
-        "DeepSeek": create_provider(DeepSeekProvider, "DEEPSEEK_API_KEY"),
-        "Groq": create_provider(GroqProvider, "GROQ_API_KEY"),
-        "Reka": create_provider(RekaProvider, "REKA_API_KEY"),
-        "Together": create_provider(TogetherProvider, "TOGETHER_API_KEY"),
-        "OpenRouter": create_provider(OpenRouterProvider, "OPENROUTER_API_KEY"),
-    }
+    _provider_map: Dict[str, Provider] = _PROVIDER_MAP
     _providers: List[BaseProvider] = []
     _models: List[str] = []
 
@@ -90,28 +131,34 @@ class LLMS:
         self._load_api_keys(kwargs)
         self._set_models(model)
         self._initialize_providers(kwargs)
+        self._pool = ThreadPoolExecutor(
+            max_workers=max(4, len(self._providers)), thread_name_prefix="llms"
+        )
 
     def __repr__(self) -> str:
         return f"LLMS({','.join(self._models)})"
 
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+
+    def __del__(self) -> None:
+        if hasattr(self, "_pool"):
+            self._pool.shutdown(wait=False)
+
     @property
     def n_provider(self) -> int:
         return len(self._providers)
 
     def list(self, query: Optional[str] = None) -> List[Dict[str, Any]]:
+        # Copy the rows so callers mutating a returned entry can't corrupt
+        # the module-level catalogue.
+        if not query:
+            return [dict(model) for model in _ALL_MODELS]
+        query = query.lower()
         return [
-            {
-                "provider": provider.__name__,
-                "name": model,
-                "cost": cost,
-            }
-            for provider in [p.provider for p in self._provider_map.values()]
-            for model, cost in provider.MODEL_INFO.items()
-            if not query
-            or (
-                query.lower() in model.lower()
-                or query.lower() in provider.__name__.lower()
-            )
+            dict(model)
+            for model in _ALL_MODELS
+            if query in model["name"].lower() or query in model["provider"].lower()
         ]
 
     def count_tokens(
@@ -139,8 +186,7 @@ class LLMS:
 
                 results = asyncio.run(gather_results())
             else:
-                with ThreadPoolExecutor() as executor:
-                    results = list(executor.map(_sync_generate, self._providers))
+                results = list(self._pool.map(_sync_generate, self._providers))
             return Results(results)
         else:
             provider = self._providers[0]
@@ -173,6 +219,8 @@ class LLMS:
         max_tokens: int = 1000,
         thinking: Optional[int] = None,
         temperature: float = 0,
+        max_concurrency: int = 5,
+        use_batch_api: bool = False,
         **kwargs: Any,
     ) -> Union[PrettyTable, str]:
         if not problems:
@@ -565,23 +613,6 @@ Question: Is there a series of flights that goes from city F to city I?",
         def evaluate_answers(
             evaluator, query_answer_pairs: List[Tuple[str, str, str]]
         ) -> List[int]:
-            system = """You are an evaluator for an AI system. Your task is to determine whether the AI's answer matches the correct answer. You will be given two inputs: the AI's answer and the correct answer. Your job is to compare these and output a binary score: 1 if the AI's answer is correct, and 0 if it is not.
-
-        To evaluate the AI's performance:
-        1. Carefully compare the AI's answer to the correct answer.
-        2. Consider the following:
-           - Does the AI's answer convey the same meaning as the correct answer?
-           - Are there any significant discrepancies or omissions in the AI's answer?
-           - If there are minor differences in wording but the core information is the same, consider it correct.
-
-        After your evaluation, provide your assessment in the following format:
-        <evaluation>
-        [Your reasoning for the score]
-        </evaluation>
-        <score>[0 or 1]</score>
-
-        Remember, output only 0 (not correct) or 1 (correct) as the final score. Do not include any additional explanation or text outside of the specified tags."""
-
             scores = []
             for i, (query, correct_answer, ai_answer) in enumerate(
                 query_answer_pairs, start=1
@@ -596,19 +627,25 @@ Question: Is there a series of flights that goes from city F to city I?",
         </correct_answer>"""
 
                 evaluator_result = evaluator.complete(
-                    prompt, system_message=system
+                    prompt, system_message=EVALUATOR_SYSTEM_PROMPT
                 ).text
                 # print(correct_answer, ai_answer, evaluator_result)
 
                 # Extract the score from the evaluator's response
-                score_match = re.search(r"<score>(\d)</score>", evaluator_result)
+                score_match = _SCORE_RE.search(evaluator_result)
                 if score_match:
-                    score = int(score_match.group(1))
-                    scores.append(score)
+                    scores.append(int(score_match.group(1)))
                 else:
-                    raise ValueError(
-                        f"Could not extract score from evaluator's response for query {i}"
-                    )
+                    # Evaluators occasionally stray from the tag format; fall
+                    # back to the last standalone 0/1 in the reply. Anything
+                    # else is not a score, so keep raising rather than feed a
+                    # stray number into the accuracy sums.
+                    scores_found = _BINARY_SCORE_RE.findall(evaluator_result)
+                    if not scores_found:
+                        raise ValueError(
+                            f"Could not extract score from evaluator's response for query {i}"
+                        )
+                    scores.append(int(scores_found[-1]))
 
             return scores
 
@@ -660,79 +697,214 @@ Question: Is there a series of flights that goes from city F to city I?",
 
             return output_data
 
+        async def aprocess_prompt(
+            model, prompt, index, evaluator, evaluation_queue, semaphore, **kwargs
+        ):
+            try:
+                print(model, index)  # , prompt[0])
+                # Prepare kwargs for complete call
+                complete_kwargs = {
+                    'max_tokens': max_tokens,
+                    'temperature': temperature,
+                    **kwargs
+                }
+
+                # Only add optional parameters if they have values
+                if reasoning_effort is not None:
+                    complete_kwargs['reasoning_effort'] = reasoning_effort
+                if thinking is not None:
+                    complete_kwargs['thinking'] = thinking
+
+                async with semaphore:
+                    # Measure latency locally: provider.latency is shared state
+                    # and concurrent in-flight prompts would overwrite it.
+                    start = time.perf_counter()
+                    result = await model.acomplete(prompt[0], **complete_kwargs)
+                    latency = time.perf_counter() - start
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                output_data = {
+                    "text": result.text,
+                    "tokens": result.meta["tokens_completion"],
+                    "latency": latency,
+                    "cost": result.meta["cost"],
+                    "prompt_index": index,
+                }
+            except Exception as e:
+                print(f"Error with {model}: {str(e)}")
+                return None
+
+            if evaluator:
+                evaluation_thread = threading.Thread(
+                    target=lambda: evaluation_queue.put(
+                        (
+                            index,
+                            evaluate_answers(
+                                evaluator, [(prompt[0], prompt[1], result.text)]
+                            )[0],
+                        )
+                    )
+                )
+                evaluation_thread.start()
+                output_data["evaluation_thread"] = evaluation_thread
+
+            return output_data
+
+        def process_prompts_async(model, prompts, evaluator, **kwargs):
+            evaluation_queue = queue.Queue()
+
+            async def gather_prompts():
+                semaphore = asyncio.Semaphore(max_concurrency)
+                return await asyncio.gather(
+                    *[
+                        aprocess_prompt(
+                            model,
+                            prompt,
+                            index,
+                            evaluator,
+                            evaluation_queue,
+                            semaphore,
+                            **kwargs,
+                        )
+                        for index, prompt in enumerate(prompts)
+                    ]
+                )
+
+            results = []
+            evaluation_threads = []
+            for result in asyncio.run(gather_prompts()):
+                if result is not None:
+                    results.append(result)
+                    if evaluator and "evaluation_thread" in result:
+                        evaluation_threads.append(result.get("evaluation_thread"))
+            return model, results, evaluation_queue, evaluation_threads
+
         def process_prompts_sequentially(model, prompts, evaluator, **kwargs):
             results = []
             evaluation_queue = queue.Queue()
             evaluation_threads = []
-            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                futures = [
-                    executor.submit(
-                        process_prompt,
-                        model,
-                        prompt,
-                        index,
-                        evaluator,
-                        evaluation_queue,
-                        **kwargs,
-                    )
-                    for index, prompt in enumerate(prompts)
-                ]
-                for future in concurrent.futures.as_completed(futures):
-                    result = future.result()
-                    if result is not None:
-                        results.append(result)
-                        if evaluator and "evaluation_thread" in result:
-                            evaluation_threads.append(result.get("evaluation_thread"))
+            for index, prompt in enumerate(prompts):
+                result = process_prompt(
+                    model, prompt, index, evaluator, evaluation_queue, **kwargs
+                )
+                if result is not None:
+                    results.append(result)
+                    if evaluator and "evaluation_thread" in result:
+                        evaluation_threads.append(result.get("evaluation_thread"))
             return model, results, evaluation_queue, evaluation_threads
 
-        # Run completion tasks in parallel for each model, but sequentially for each prompt within a model
-        with ThreadPoolExecutor() as executor:
-            futures = [
-                executor.submit(
-                    process_prompts_sequentially, model, problems, evaluator, **kwargs
+        def process_prompts_batch(model, prompts, evaluator, **kwargs):
+            results = []
+            evaluation_queue = queue.Queue()
+            evaluation_threads = []
+
+            complete_kwargs = {
+                'max_tokens': max_tokens,
+                'temperature': temperature,
+                **kwargs
+            }
+            if reasoning_effort is not None:
+                complete_kwargs['reasoning_effort'] = reasoning_effort
+            if thinking is not None:
+                complete_kwargs['thinking'] = thinking
+
+            try:
+                start = time.perf_counter()
+                batch_results = model.complete_batch(
+                    [prompt[0] for prompt in prompts], **complete_kwargs
                 )
-                for model in self._providers
-            ]
+                elapsed = time.perf_counter() - start
+            except Exception as e:
+                print(f"Error with {model}: {str(e)}")
+                return model, results, evaluation_queue, evaluation_threads
 
-            for future in as_completed(futures):
-                try:
-                    (
-                        model,
-                        outputs,
-                        evaluation_queue,
-                        evaluation_threads,
-                    ) = future.result()
-                    if not outputs:  # Skip if no successful outputs
-                        continue
-
-                    if outputs:  # Only process if we have valid outputs
-                        model_results[model] = {
-                            "outputs": outputs,
-                            "total_latency": 0,
-                            "total_cost": 0,
-                            "evaluation": [None] * len(outputs),
-                        }
-
-                        for output_data in outputs:
-                            if output_data:  # Check if output_data is not None
-                                model_results[model]["total_latency"] += output_data["latency"]
-                                model_results[model]["total_cost"] += output_data["cost"]
-
-                        if evaluator and evaluation_threads:
-                            # Wait for all evaluation threads to complete
-                            for thread in evaluation_threads:
-                                if thread:  # Check if thread exists
-                                    thread.join()
-
-                            # Process all evaluation results
-                            while not evaluation_queue.empty():
-                                index, evaluation = evaluation_queue.get()
-                                model_results[model]["evaluation"][index] = evaluation
-                except Exception as e:
-                    print(f"Error processing results: {str(e)}")
-                    # Don't add failed models to results
+            # The batch completes as a whole, so attribute the elapsed time
+            # evenly across prompts to keep per-prompt metrics meaningful.
+            latency = elapsed / max(len(prompts), 1)
+            for index, (prompt, result) in enumerate(zip(prompts, batch_results)):
+                if result is None:
+                    continue
+                output_data = {
+                    "text": result.text,
+                    "tokens": result.meta["tokens_completion"],
+                    "latency": latency,
+                    "cost": result.meta["cost"],
+                    "prompt_index": index,
+                }
+                if evaluator:
+                    evaluation_thread = threading.Thread(
+                        target=lambda index=index, prompt=prompt, result=result: evaluation_queue.put(
+                            (
+                                index,
+                                evaluate_answers(
+                                    evaluator, [(prompt[0], prompt[1], result.text)]
+                                )[0],
+                            )
+                        )
+                    )
+                    evaluation_thread.start()
+                    output_data["evaluation_thread"] = evaluation_thread
+                    evaluation_threads.append(evaluation_thread)
+                results.append(output_data)
+            return model, results, evaluation_queue, evaluation_threads
+
+        def process_prompts(model, prompts, evaluator, **kwargs):
+            # Overlap a model's prompts in-flight when the provider supports
+            # async completion; otherwise fall back to the sequential loop.
+            if use_batch_api and hasattr(model, "complete_batch"):
+                return process_prompts_batch(model, prompts, evaluator, **kwargs)
+            if type(model).acomplete is not BaseProvider.acomplete:
+                return process_prompts_async(model, prompts, evaluator, **kwargs)
+            return process_prompts_sequentially(model, prompts, evaluator, **kwargs)
+
+        # Run completion tasks in parallel for each model, with a model's
+        # prompts pipelined concurrently where the provider supports it.
+        # Reuses the instance pool (sized to the provider count) rather than
+        # spinning up another executor per benchmark call.
+        futures = [
+            self._pool.submit(process_prompts, model, problems, evaluator, **kwargs)
+            for model in self._providers
+        ]
+
+        for future in as_completed(futures):
+            try:
+                (
+                    model,
+                    outputs,
+                    evaluation_queue,
+                    evaluation_threads,
+                ) = future.result()
+                if not outputs:  # Skip if no successful outputs
                     continue
 
+                if outputs:  # Only process if we have valid outputs
+                    model_results[model] = {
+                        "outputs": outputs,
+                        "total_latency": 0,
+                        "total_cost": 0,
+                        "evaluation": [None] * len(outputs),
+                    }
+
+                    for output_data in outputs:
+                        if output_data:  # Check if output_data is not None
+                            model_results[model]["total_latency"] += output_data["latency"]
+                            model_results[model]["total_cost"] += output_data["cost"]
+
+                    if evaluator and evaluation_threads:
+                        # Wait for all evaluation threads to complete
+                        for thread in evaluation_threads:
+                            if thread:  # Check if thread exists
+                                thread.join()
+
+                        # Process all evaluation results
+                        while not evaluation_queue.empty():
+                            index, evaluation = evaluation_queue.get()
+                            model_results[model]["evaluation"][index] = evaluation
+            except Exception as e:
+                print(f"Error processing results: {str(e)}")
+                # Don't add failed models to results
+                continue
+
         for model in model_results:
             outputs = model_results[model]["outputs"]
             model_results[model]["median_latency"] = statistics.median(
@@ -788,36 +960,27 @@ Question: Is there a series of flights that goes from city F to city I?",
                     valid_evaluations += 1
                 row_data = [
                     str(model),
-                    output_data["text"],
+                    *([output_data["text"]] if show_outputs else []),
                     output_data["tokens"],
                     f'{output_data["cost"]:.5f}',
                     f'{output_data["latency"]:.2f}',
                     f'{output_data["tokens"]/output_data["latency"]:.2f}',
+                    *(
+                        [model_results[model]["evaluation"][index]]
+                        if evaluator
+                        else []
+                    ),
                 ]
-                if not show_outputs:
-                    row_data.remove(output_data["text"])
-                if evaluator:
-                    row_data.append(model_results[model]["evaluation"][index])
                 table.add_row(row_data)
 
-            if show_outputs:
-                row_data = [
-                    str(model),
-                    "",
-                    f"{total_tokens}",
-                    f"{model_data['total_cost']:.5f}",
-                    f"{model_data['median_latency']:.2f}",
-                    f"{total_tokens/model_data['total_latency']:.2f}",
-                ]
-
-            else:
-                row_data = [
-                    str(model),
-                    f"{total_tokens}",
-                    f"{model_data['total_cost']:.5f}",
-                    f"{model_data['median_latency']:.2f}",
-                    f"{total_tokens/model_data['total_latency']:.2f}",
-                ]
+            row_data = [
+                str(model),
+                *([""] if show_outputs else []),
+                f"{total_tokens}",
+                f"{model_data['total_cost']:.5f}",
+                f"{model_data['median_latency']:.2f}",
+                f"{total_tokens/model_data['total_latency']:.2f}",
+            ]
             if evaluator:
                 if valid_evaluations > 0:
                     acc = 100 * total_score / valid_evaluations
@@ -911,7 +1074,10 @@ Question: Is there a series of flights that goes from city F to city I?",
         self._providers = [
             provider.provider(model=single_model, **({**kwargs, 'api_key': provider.api_key} if provider.needs_api_key else kwargs))
             for single_model in self._models
-            for provider in self._provider_map.values()
+            for provider in (
+                self._provider_map[name]
+                for name in _MODEL_TO_PROVIDERS.get(single_model, [])
+            )
             if self._validate_model(single_model, provider)
         ]
 
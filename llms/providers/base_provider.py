@@ -29,20 +29,21 @@ class BaseProvider:
 
     @contextmanager
     def track_latency(self):
+        # Keep the raw float; callers format at the display boundary.
         start = time.perf_counter()
         try:
             yield
         finally:
-            self.latency = round(time.perf_counter() - start, 2)
+            self.latency = time.perf_counter() - start
 
     def compute_cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        # Raw cost, unrounded: cheap calls can be well under $0.00001 and
+        # rounding here would collapse them to zero before any aggregation.
         cost_per_token = self.MODEL_INFO[self.model]
-        cost = (
+        return (
             (prompt_tokens * cost_per_token["prompt"])
             + (completion_tokens * cost_per_token["completion"])
         ) / 1_000_000
-        cost = round(cost, 5)
-        return cost
 
     def count_tokens(self, content):
         raise NotImplementedError(
@@ -0,0 +1,91 @@
+# llms/providers/cache.py
+
+import hashlib
+import json
+import time
+from typing import Any, Dict, Optional
+
+
+class LLMCache:
+    """In-process response cache for deterministic (temperature==0) completions.
+
+    Exact matches are keyed on a SHA-256 of the full serialized model inputs,
+    so any generation parameter that changes the response changes the key. With
+    ``semantic=True`` a local MiniLM embedding index is also kept, and prompts
+    whose cosine similarity to a cached prompt is at least ``threshold`` reuse
+    the cached response. Semantic mode requires the optional
+    ``sentence-transformers`` and ``faiss`` packages.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[Dict[str, Any]] = None,
+        ttl: int = 3600,
+        semantic: bool = False,
+        threshold: float = 0.92,
+    ):
+        self._store = backend if backend is not None else {}
+        self.ttl = ttl
+        self.threshold = threshold
+        self.semantic = semantic
+
+        self._embedder = None
+        self._index = None
+        self._index_keys = []
+        if semantic:
+            try:
+                import faiss
+                from sentence_transformers import SentenceTransformer
+            except ImportError as e:
+                raise ImportError(
+                    "Semantic caching requires the sentence-transformers and "
+                    "faiss packages"
+                ) from e
+            self._embedder = SentenceTransformer(
+                "sentence-transformers/all-MiniLM-L6-v2"
+            )
+            self._index = faiss.IndexFlatIP(
+                self._embedder.get_sentence_embedding_dimension()
+            )
+
+    @staticmethod
+    def cache_key(model: str, model_inputs: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"model": model, "model_inputs": model_inputs},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str, prompt: Optional[str] = None) -> Optional[Dict]:
+        entry = self._store.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if time.monotonic() < expires_at:
+                return value
+            del self._store[key]
+        if self.semantic and prompt is not None:
+            return self._semantic_get(prompt)
+        return None
+
+    def set(self, key: str, value: Dict, prompt: Optional[str] = None) -> None:
+        self._store[key] = (time.monotonic() + self.ttl, value)
+        if self.semantic and prompt is not None:
+            self._index.add(self._embed(prompt))
+            self._index_keys.append(key)
+
+    def _embed(self, prompt: str):
+        return self._embedder.encode([prompt], normalize_embeddings=True)
+
+    def _semantic_get(self, prompt: str) -> Optional[Dict]:
+        if self._index.ntotal == 0:
+            return None
+        scores, ids = self._index.search(self._embed(prompt), 1)
+        if scores[0][0] < self.threshold:
+            return None
+        entry = self._store.get(self._index_keys[ids[0][0]])
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            return None
+        return value
@@ -1,11 +1,58 @@
+import functools
+import itertools
+import os
+import tempfile
+import time
 from typing import AsyncGenerator, Dict, Generator, List, Optional, Union
+
+# Point tiktoken at a shared on-disk cache (it reads the variable when an
+# encoding is first loaded) so multi-process deployments download and parse
+# the BPE files once instead of once per worker.
+os.environ.setdefault(
+    "TIKTOKEN_CACHE_DIR", os.path.join(tempfile.gettempdir(), "tiktoken")
+)
+
 import tiktoken
 
+import httpx
 from openai import AsyncOpenAI, OpenAI
 import json
 
+try:
+    # orjson handles large payloads in native code, 2-3x faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _jsonl_dumps(records: List[dict]) -> bytes:
+    """Serialize records to JSONL bytes, via orjson when installed."""
+    if orjson is not None:
+        return b"\n".join(orjson.dumps(record) for record in records)
+    return "\n".join(json.dumps(record) for record in records).encode()
+
 from ..results.result import AsyncStreamResult, Result, StreamResult
 from .base_provider import BaseProvider
+from .cache import LLMCache
+
+# Shared keep-alive HTTP client so every OpenAIProvider instance reuses the
+# same connection pool instead of paying a TLS handshake per provider/call.
+# Only the sync client can be shared: an httpx.AsyncClient is bound to the
+# event loop its connections were created on, and this library runs
+# short-lived loops (asyncio.run per acomplete/benchmark call, sometimes in
+# parallel threads), so async clients stay per SDK-client instance.
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=60
+)
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+_HTTP = httpx.Client(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+
+
+@functools.lru_cache(maxsize=16)
+def _encoding_for(model: str) -> tiktoken.Encoding:
+    return tiktoken.encoding_for_model(model)
 
 
 class OpenAIProvider(BaseProvider):
@@ -31,27 +78,54 @@ class OpenAIProvider(BaseProvider):
 
     def __init__(
         self,
-        api_key: Union[str, None] = None,
+        api_key: Union[str, List[str], None] = None,
         model: Union[str, None] = None,
         client_kwargs: Union[dict, None] = None,
         async_client_kwargs: Union[dict, None] = None,
+        enable_cache: bool = False,
+        cache: Union[LLMCache, None] = None,
     ):
         if model is None:
             model = list(self.MODEL_INFO.keys())[0]
         self.model = model
+        self._use_max_completion_tokens = self.MODEL_INFO.get(model, {}).get(
+            "use_max_completion_tokens", False
+        )
+        self.cache = cache if cache is not None else (LLMCache() if enable_cache else None)
+        # A list of api keys round-robins requests across them, multiplying
+        # the effective rate limit; the shared pooled http client keeps the
+        # extra SDK clients cheap.
+        api_keys = api_key if isinstance(api_key, list) else [api_key]
         if client_kwargs is None:
             client_kwargs = {}
-        self.client = OpenAI(api_key=api_key, **client_kwargs)
+        client_kwargs.setdefault("http_client", _HTTP)
+        self.clients = [OpenAI(api_key=key, **client_kwargs) for key in api_keys]
         if async_client_kwargs is None:
             async_client_kwargs = {}
-        self.async_client = AsyncOpenAI(api_key=api_key, **async_client_kwargs)
+        self.async_clients = [
+            AsyncOpenAI(api_key=key, **async_client_kwargs) for key in api_keys
+        ]
+        self._client_cycle = itertools.cycle(self.clients)
+        self._async_client_cycle = itertools.cycle(self.async_clients)
+
+    @property
+    def client(self) -> OpenAI:
+        return next(self._client_cycle)
+
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        return next(self._async_client_cycle)
 
     @property
     def is_chat_model(self) -> bool:
         return self.MODEL_INFO[self.model]['is_chat']
 
+    @property
+    def _enc(self) -> tiktoken.Encoding:
+        return _encoding_for(self.model)
+
     def count_tokens(self, content: Union[str, List[dict]]) -> int:
-        enc = tiktoken.encoding_for_model(self.model)
+        enc = self._enc
         if isinstance(content, list):
             # When field name is present, ChatGPT will ignore the role token.
             # Adopted from OpenAI cookbook
@@ -60,16 +134,14 @@ class OpenAIProvider(BaseProvider):
             formatting_token_count = 4
 
             messages = content
-            messages_text = ["".join(message.values()) for message in messages]
-            tokens = [enc.encode(t, disallowed_special=()) for t in messages_text]
-
-            n_tokens_list = []
-            for token, message in zip(tokens, messages):
-                n_tokens = len(token) + formatting_token_count
-                if "name" in message:
-                    n_tokens += -1
-                n_tokens_list.append(n_tokens)
-            return sum(n_tokens_list)
+            tokens = enc.encode_batch(
+                ["".join(message.values()) for message in messages],
+                disallowed_special=(),
+            )
+            return sum(
+                len(token) + formatting_token_count - (1 if "name" in message else 0)
+                for token, message in zip(tokens, messages)
+            )
         else:
             return len(enc.encode(content, disallowed_special=()))
 
@@ -105,7 +177,7 @@ class OpenAIProvider(BaseProvider):
             }
 
             # Use max_completion_tokens for models that require it
-            if self.MODEL_INFO[self.model].get("use_max_completion_tokens", False):
+            if self._use_max_completion_tokens:
                 model_inputs["max_completion_tokens"] = max_tokens
             else:
                 model_inputs["max_tokens"] = max_tokens
@@ -156,6 +228,23 @@ class OpenAIProvider(BaseProvider):
             **kwargs,
         )
 
+        cache_key = None
+        if self.cache is not None and temperature == 0:
+            cache_key = LLMCache.cache_key(self.model, model_inputs)
+            cached = self.cache.get(cache_key, prompt)
+            if cached is not None:
+                return Result(
+                    text=cached["text"],
+                    model_inputs=model_inputs,
+                    provider=self,
+                    meta={
+                        "tokens_prompt": cached["tokens_prompt"],
+                        "tokens_completion": cached["tokens_completion"],
+                        "latency": 0.0,
+                    },
+                    function_call=cached.get("function_call") or {},
+                )
+
         with self.track_latency():
             if self.is_chat_model:
                 response = self.client.chat.completions.create(model=self.model, **model_inputs)
@@ -169,7 +258,7 @@ class OpenAIProvider(BaseProvider):
             if is_func_call:
                 function_call = {
                     "name": response.choices[0].message.function_call.name,
-                    "arguments": json.loads(response.choices[0].message.function_call.arguments)
+                    "arguments": _json_loads(response.choices[0].message.function_call.arguments)
                 }
             else:
                 completion = response.choices[0].message.content.strip()
@@ -183,6 +272,19 @@ class OpenAIProvider(BaseProvider):
             "tokens_completion": usage.completion_tokens,
             "latency": self.latency,
         }
+
+        if cache_key is not None:
+            self.cache.set(
+                cache_key,
+                {
+                    "text": completion,
+                    "tokens_prompt": usage.prompt_tokens,
+                    "tokens_completion": usage.completion_tokens,
+                    "function_call": function_call,
+                },
+                prompt,
+            )
+
         return Result(
             text=completion,
             model_inputs=model_inputs,
@@ -215,24 +317,60 @@ class OpenAIProvider(BaseProvider):
             **kwargs,
         )
 
+        cache_key = None
+        if self.cache is not None and temperature == 0:
+            cache_key = LLMCache.cache_key(self.model, model_inputs)
+            cached = self.cache.get(cache_key, prompt)
+            if cached is not None:
+                return Result(
+                    text=cached["text"],
+                    model_inputs=model_inputs,
+                    provider=self,
+                    meta={
+                        "tokens_prompt": cached["tokens_prompt"],
+                        "tokens_completion": cached["tokens_completion"],
+                        "latency": 0.0,
+                    },
+                )
+
         with self.track_latency():
             if self.is_chat_model:
+                # Stream and accumulate so work starts at first token instead
+                # of waiting for the full generation; the final chunk carries
+                # the usage numbers the meta/cost math relies on.
+                model_inputs["stream"] = True
+                model_inputs["stream_options"] = {"include_usage": True}
                 response = await self.async_client.chat.completions.create(model=self.model, **model_inputs)
+                chunks = []
+                usage = None
+                async for chunk in response:
+                    if chunk.usage is not None:
+                        usage = chunk.usage
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        chunks.append(chunk.choices[0].delta.content)
+                completion = "".join(chunks).strip()
             else:
                 response = await self.async_client.completions.create(model=self.model, **model_inputs)
-
-        if self.is_chat_model:
-            completion = response.choices[0].message.content.strip()
-        else:
-            completion = response.choices[0].text.strip()
-
-        usage = response.usage
+                completion = response.choices[0].text.strip()
+                usage = response.usage
 
         meta = {
             "tokens_prompt": usage.prompt_tokens,
             "tokens_completion": usage.completion_tokens,
             "latency": self.latency,
         }
+
+        if cache_key is not None:
+            self.cache.set(
+                cache_key,
+                {
+                    "text": completion,
+                    "tokens_prompt": usage.prompt_tokens,
+                    "tokens_completion": usage.completion_tokens,
+                },
+                prompt,
+            )
+
         return Result(
             text=completion,
             model_inputs=model_inputs,
@@ -240,6 +378,101 @@ class OpenAIProvider(BaseProvider):
             meta=meta,
         )
 
+    def complete_batch(
+        self,
+        prompts: List[str],
+        system_message: Union[str, List[dict], None] = None,
+        temperature: float = 0,
+        max_tokens: int = 300,
+        poll_interval: float = 5.0,
+        **kwargs,
+    ) -> List[Optional[Result]]:
+        """Run many prompts through OpenAI's Batch API.
+
+        Batched requests are billed at half price and queued server-side, so
+        this is suited to offline runs (e.g. benchmarks) where latency does
+        not matter. Blocks until the batch finishes, polling with exponential
+        backoff. Returns one Result per prompt; entries the batch failed to
+        answer are None.
+        """
+        if not self.is_chat_model:
+            raise ValueError(
+                f"Batch API is only supported for chat models, not {self.model}"
+            )
+
+        model_inputs_list = [
+            self._prepare_model_inputs(
+                prompt=prompt,
+                system_message=system_message,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+            for prompt in prompts
+        ]
+        records = [
+            {
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": self.model,
+                    **{k: v for k, v in model_inputs.items() if k != "stream"},
+                },
+            }
+            for i, model_inputs in enumerate(model_inputs_list)
+        ]
+
+        # Pin one client: the whole batch lifecycle must run under one key
+        client = self.client
+        batch_file = client.files.create(
+            file=("batch.jsonl", _jsonl_dumps(records)), purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+        with self.track_latency():
+            interval = poll_interval
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(interval)
+                interval = min(interval * 2, 60)
+                batch = client.batches.retrieve(batch.id)
+
+        if batch.status != "completed":
+            raise RuntimeError(
+                f"Batch {batch.id} finished with status {batch.status}"
+            )
+
+        results: List[Optional[Result]] = [None] * len(prompts)
+        output = client.files.content(batch.output_file_id).text
+        for line in output.splitlines():
+            if not line:
+                continue
+            item = _json_loads(line)
+            index = int(item["custom_id"])
+            body = item["response"]["body"]
+            usage = body["usage"]
+            results[index] = Result(
+                text=(body["choices"][0]["message"]["content"] or "").strip(),
+                model_inputs=model_inputs_list[index],
+                provider=self,
+                meta={
+                    "tokens_prompt": usage["prompt_tokens"],
+                    "tokens_completion": usage["completion_tokens"],
+                    "latency": self.latency,
+                    # Batch API requests are billed at a 50% discount
+                    "cost": self.compute_cost(
+                        prompt_tokens=usage["prompt_tokens"],
+                        completion_tokens=usage["completion_tokens"],
+                    )
+                    / 2,
+                },
+            )
+        return results
+
     def complete_stream(
         self,
         prompt: str,
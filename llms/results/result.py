@@ -5,6 +5,22 @@ from warnings import warn
 
 from llms.providers.base_provider import BaseProvider
 
+# Shared converter so repeated html accesses don't re-initialize markdown2.
+_markdown_converter = None
+
+
+def _to_html(text: str) -> str:
+    global _markdown_converter
+    if _markdown_converter is None:
+        try:
+            import markdown2
+        except ImportError as e:
+            raise ImportError(
+                "The html property requires the markdown2 package"
+            ) from e
+        _markdown_converter = markdown2.Markdown()
+    return _markdown_converter.convert(text)
+
 
 class Result:
     def __init__(
@@ -20,6 +36,13 @@ class Result:
         self.provider = provider
         self.model_inputs = model_inputs
         self.function_call = function_call or {}
+        self._html = None
+
+    @property
+    def html(self) -> str:
+        if self._html is None:
+            self._html = _to_html(self.text)
+        return self._html
 
     @property
     def tokens_completion(self) -> int:
@@ -91,6 +114,10 @@ class Results:
     def text(self):
         return [result.text for result in self._results]
 
+    @property
+    def html(self):
+        return [result.html for result in self._results]
+
     @property
     def meta(self):
         return [result.meta for result in self._results]